@@ -4,6 +4,7 @@ const path = require("path");
 
 const domainsPath = path.resolve("domains");
 const files = fs.readdirSync(domainsPath).filter((file) => file.endsWith(".json"));
+const fileSet = new Set(files);
 
 const domainCache = {};
 
@@ -30,7 +31,7 @@ t("Nested subdomains should not exist without a parent subdomain", (t) => {
             const parent = parts.slice(i).join(".");
             if (parent.startsWith("_")) continue;
 
-            t.true(files.includes(`${parent}.json`), `${file}: Parent subdomain "${parent}" does not exist`);
+            t.true(fileSet.has(`${parent}.json`), `${file}: Parent subdomain "${parent}" does not exist`);
         }
     });
 });
@@ -42,7 +43,7 @@ t("Nested subdomains should not exist if any parent subdomain has NS records", (
 
         for (let i = 1; i < parts.length; i++) {
             const parent = parts.slice(i).join(".");
-            if (parent.startsWith("_") || !files.includes(`${parent}.json`)) continue;
+            if (parent.startsWith("_") || !fileSet.has(`${parent}.json`)) continue;
             const parentData = getDomainData(parent);
 
             t.true(!parentData.records.NS, `${file}: Parent subdomain "${parent}" has NS records`);
@@ -31,9 +31,10 @@ const blockedFields = ["domain", "internal", "proxy", "reserved", "services", "s
 
 const emailRegex = /^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$/;
 const hostnameRegex = /^(?=.{1,253}$)(?:(?:[_a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?)\.)+[a-zA-Z]{2,63}$/;
+const keyRegex = /"(.*?)"\s*:/y;
 
-const internalDomains = require("../util/internal.json");
-const reservedDomains = require("../util/reserved.json");
+const internalDomains = new Set(require("../util/internal.json"));
+const reservedDomains = new Set(require("../util/reserved.json"));
 
 const domainsPath = path.resolve("domains");
 const files = fs.readdirSync(domainsPath);
@@ -42,8 +43,6 @@ function findDuplicateKeys(jsonString) {
     const duplicateKeys = new Set();
     const keyStack = [];
 
-    const keyRegex = /"(.*?)"\s*:/g;
-
     let i = 0;
     while (i < jsonString.length) {
         const char = jsonString[i];
@@ -81,6 +80,16 @@ function findDuplicateKeys(jsonString) {
     return [...duplicateKeys];
 }
 
+function hasParentIn(subdomain, names) {
+    const parts = subdomain.split(".");
+
+    for (let i = 1; i < parts.length; i++) {
+        if (names.has(parts.slice(i).join("."))) return true;
+    }
+
+    return false;
+}
+
 async function validateFields(t, obj, fields, file, prefix = "") {
     for (const key of Object.keys(fields)) {
         const fieldPath = prefix ? `${prefix}.${key}` : key;
@@ -106,13 +115,10 @@ async function validateFileName(t, file) {
         hostnameRegex,
         `${file}: FQDN must be 1-253 characters, can use letters, numbers, dots, and non-consecutive hyphens.`
     );
-    t.false(internalDomains.includes(subdomain), `${file}: Subdomain name is registered internally`);
-    t.false(reservedDomains.includes(subdomain), `${file}: Subdomain name is reserved`);
-    t.true(
-        !internalDomains.some((i) => subdomain.endsWith(`.${i}`)),
-        `${file}: Subdomain name is registered internally`
-    );
-    t.true(!reservedDomains.some((r) => subdomain.endsWith(`.${r}`)), `${file}: Subdomain name is reserved`);
+    t.false(internalDomains.has(subdomain), `${file}: Subdomain name is registered internally`);
+    t.false(reservedDomains.has(subdomain), `${file}: Subdomain name is reserved`);
+    t.true(!hasParentIn(subdomain, internalDomains), `${file}: Subdomain name is registered internally`);
+    t.true(!hasParentIn(subdomain, reservedDomains), `${file}: Subdomain name is reserved`);
 
     const rootSubdomain = subdomain.split(".").pop();
     t.false(rootSubdomain.startsWith("_"), `${file}: Root subdomains should not start with an underscore`);